@@ -19,6 +19,7 @@ predictor = None
 
 players_index = None
 MIN_PA_FULLTIME = 100
+MAX_BATCH_NAMES = 32
 
 def initialize_predictor():
     global predictor, players_index
@@ -98,10 +99,14 @@ def predict():
         data = request.json
         player_name = data.get('name')
         
-        if not player_name:
+        if not isinstance(player_name, str) or not player_name.strip():
             return jsonify({'error': 'Player name is required'}), 400
         
-        result = predictor.predict(player_name)
+        seed = data.get('seed', 0)
+        if isinstance(seed, bool) or not isinstance(seed, int):
+            return jsonify({'error': 'Seed must be an integer'}), 400
+        
+        result = predictor.predict(player_name, seed=seed)
         return jsonify(result)
     
     except ValueError as e:
@@ -109,6 +114,33 @@ def predict():
     except Exception as e:
         return jsonify({'error': f'Prediction failed: {str(e)}'}), 500
 
+@app.route('/api/predict_batch', methods=['POST'])
+def predict_batch():
+    try:
+        data = request.json
+        player_names = data.get('names')
+        
+        if not player_names or not isinstance(player_names, list):
+            return jsonify({'error': 'A list of player names is required'}), 400
+        
+        if len(player_names) > MAX_BATCH_NAMES:
+            return jsonify({'error': f'At most {MAX_BATCH_NAMES} names per batch'}), 400
+        
+        if not all(isinstance(n, str) and n.strip() for n in player_names):
+            return jsonify({'error': 'Player names must be non-empty strings'}), 400
+        
+        seed = data.get('seed', 0)
+        if isinstance(seed, bool) or not isinstance(seed, int):
+            return jsonify({'error': 'Seed must be an integer'}), 400
+        
+        results = predictor.predict_batch(player_names, seed=seed)
+        return jsonify(results)
+    
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 404
+    except Exception as e:
+        return jsonify({'error': f'Prediction failed: {str(e)}'}), 500
+
 if __name__ == '__main__':
     initialize_predictor()
     app.run(host='0.0.0.0', port=5000, debug=True)
\ No newline at end of file
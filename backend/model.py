@@ -1,3 +1,4 @@
+import hashlib
 import math
 import numpy as np
 import pandas as pd
@@ -23,6 +24,39 @@ posterior_var = b * (1.0 - alpha_bar_prev) / (1.0 - alpha_bar)
 def _extract(arr_1d, t, ndim):
     return arr_1d[t].view(t.shape[0], *([1]*(ndim-1)))
 
+# RNG streams
+def model_fingerprint(model):
+    h = hashlib.sha256()
+    for name, tensor in model.state_dict().items():
+        h.update(name.encode())
+        h.update(tensor.detach().cpu().contiguous().numpy().tobytes())
+    return h.hexdigest()
+
+def make_generator(player_id, fingerprint, seed=0):
+    # Each (player, model, seed) triple gets its own stream, independent of the global RNG.
+    # Streams always live on the CPU so the noise is the same on CPU and CUDA hosts.
+    key = f"{player_id}|{fingerprint}|{seed}".encode()
+    stream_seed = int.from_bytes(hashlib.sha256(key).digest()[:8], "big") & ((1 << 63) - 1)
+    g = torch.Generator(device="cpu")
+    g.manual_seed(stream_seed)
+    return g
+
+def _initial_noise(B, y_dim, generator):
+    if generator is None:
+        return torch.randn((B, y_dim), device=device)
+    return torch.randn((B, y_dim), generator=generator).to(device)
+
+def _split_sizes(B, generators, split_sizes):
+    if len(generators) == 0:
+        raise ValueError("At least one generator is required")
+    if split_sizes is None:
+        if B % len(generators) != 0:
+            raise ValueError("Batch size must be divisible by the number of generators")
+        split_sizes = [B // len(generators)] * len(generators)
+    if len(split_sizes) != len(generators) or sum(split_sizes) != B:
+        raise ValueError("split_sizes must match the generators and the batch size")
+    return split_sizes
+
 # Model Architecture
 class SinusoidalTimeEmbedding(nn.Module):
     def __init__(self, dim):
@@ -62,10 +96,24 @@ class TabDDPMModel(nn.Module):
         return self.net(x)
 
 @torch.no_grad()
-def sample(model, cond, clip_x0=3.0):
+def sample(model, cond, clip_x0=3.0, generator=None, split_sizes=None):
+    # generator: None (global RNG), a torch.Generator, or a list of generators,
+    # one per consecutive sub-batch of cond (sized by split_sizes, default equal).
+    # Sub-batches are denoised separately so each sees the same tensor shapes
+    # as a standalone call, keeping results bit-identical.
     model.eval()
+    if generator is None or isinstance(generator, torch.Generator):
+        return _sample_chunk(model, cond, clip_x0, generator)
+    
+    sizes = _split_sizes(cond.shape[0], generator, split_sizes)
+    return torch.cat([
+        _sample_chunk(model, c, clip_x0, g)
+        for c, g in zip(torch.split(cond, sizes), generator)
+    ], dim=0)
+
+def _sample_chunk(model, cond, clip_x0, generator):
     B = cond.shape[0]
-    y = torch.randn((B, 2), device=device)
+    y = _initial_noise(B, 2, generator)
     
     for i in range(Time - 1, -1, -1):
         t = torch.full((B,), i, device=device, dtype=torch.long)
@@ -86,4 +134,4 @@ def sample(model, cond, clip_x0=3.0):
             ab_prev = _extract(alpha_bar, t_prev, y.ndim)
             y = torch.sqrt(ab_prev) * x0 + torch.sqrt(1.0 - ab_prev) * eps
     
-    return y
\ No newline at end of file
+    return y
@@ -1,6 +1,6 @@
 import torch
 import numpy as np
-from model import TabDDPMModel, sample, device
+from model import TabDDPMModel, sample, device, model_fingerprint, make_generator
 from data_processing import logit, inv_logit, safe_log, safe_exp
 
 UPCOMING_YEAR = 2026
@@ -13,6 +13,7 @@ class BaseballPredictor:
         checkpoint = torch.load(model_path, map_location=device)
         self.model.load_state_dict(checkpoint['model'])
         self.model.eval()
+        self.fingerprint = model_fingerprint(self.model)
         
         self.cond_scaler = cond_scaler
         self.y_scaler = y_scaler
@@ -36,8 +37,7 @@ class BaseballPredictor:
             "p90": float(np.quantile(x, 0.90)),
         }
     
-    @torch.no_grad()
-    def predict(self, full_name):
+    def build_condition(self, full_name):
         playerID = self.get_player_id(full_name)
         
         hist = self.season_stats[
@@ -64,22 +64,28 @@ class BaseballPredictor:
         cond_raw = np.array([[prev_zobp, prev_lslg, prev_pa, age_next]], dtype=np.float32)
         cond_scaled = self.cond_scaler.transform(cond_raw)
         
-        cond = torch.tensor(
-            np.repeat(cond_scaled, N_SAMPLES, axis=0),
-            dtype=torch.float32,
-            device=device
-        )
-        
-        y_scaled = sample(self.model, cond, clip_x0=3.0).cpu().numpy()
+        return {
+            "playerID": playerID,
+            "prev_year": prev_year,
+            "age_next": age_next,
+            "prev_obp": prev_obp,
+            "prev_slg": prev_slg,
+            "prev_pa": prev_pa,
+            "prev_zobp": prev_zobp,
+            "prev_lslg": prev_lslg,
+            "cond_scaled": cond_scaled,
+        }
+    
+    def summarize_samples(self, full_name, c, y_scaled, seed):
         y_delta = self.y_scaler.inv(y_scaled)
         
         d_zobp = y_delta[:, 0]
         d_logslg = y_delta[:, 1]
         
-        zobp_next = prev_zobp + d_zobp
+        zobp_next = c["prev_zobp"] + d_zobp
         obp_next = inv_logit(zobp_next)
         
-        logslg_next = prev_lslg + d_logslg
+        logslg_next = c["prev_lslg"] + d_logslg
         slg_next = safe_exp(logslg_next)
         
         obp_next = np.clip(obp_next, 0.0, 1.0)
@@ -88,16 +94,43 @@ class BaseballPredictor:
         
         return {
             "name": full_name,
-            "playerID": playerID,
+            "playerID": c["playerID"],
             "upcoming_year": UPCOMING_YEAR,
+            "seed": seed,
             "condition_used": {
-                "prev_year": prev_year,
-                "prev_OBP": prev_obp,
-                "prev_SLG": prev_slg,
-                "prev_PA": int(prev_pa),
-                "age_next": age_next,
+                "prev_year": c["prev_year"],
+                "prev_OBP": c["prev_obp"],
+                "prev_SLG": c["prev_slg"],
+                "prev_PA": int(c["prev_pa"]),
+                "age_next": c["age_next"],
             },
             "OBP": self.summarize_dist(obp_next),
             "SLG": self.summarize_dist(slg_next),
             "OPS": self.summarize_dist(ops_next),
-        }
\ No newline at end of file
+        }
+    
+    def predict(self, full_name, seed=0):
+        return self.predict_batch([full_name], seed=seed)[0]
+    
+    @torch.no_grad()
+    def predict_batch(self, full_names, seed=0):
+        # One sampler call for all players; each player keeps its own RNG stream
+        # and N_SAMPLES-row chunk so results match predict() for the same (player, model, seed)
+        if not full_names:
+            return []
+        
+        conds = [self.build_condition(name) for name in full_names]
+        
+        cond = torch.tensor(
+            np.concatenate([np.repeat(c["cond_scaled"], N_SAMPLES, axis=0) for c in conds]),
+            dtype=torch.float32,
+            device=device
+        )
+        generators = [make_generator(c["playerID"], self.fingerprint, seed) for c in conds]
+        
+        y_scaled = sample(self.model, cond, clip_x0=3.0, generator=generators).cpu().numpy()
+        
+        return [
+            self.summarize_samples(name, c, y_scaled[i * N_SAMPLES:(i + 1) * N_SAMPLES], seed)
+            for i, (name, c) in enumerate(zip(full_names, conds))
+        ]
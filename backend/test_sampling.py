@@ -0,0 +1,98 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+pd = pytest.importorskip("pandas")
+torch = pytest.importorskip("torch")
+
+import predictor
+from model import TabDDPMModel, sample, device, model_fingerprint, make_generator
+from predictor import BaseballPredictor
+from data_processing import ZScaler
+
+
+@pytest.fixture
+def tiny_model():
+    torch.manual_seed(0)
+    return TabDDPMModel(y_dim=2, cond_dim=4, timeEmbShape=8, hidden=16).to(device)
+
+
+def test_make_generator_is_reproducible(tiny_model):
+    fp = model_fingerprint(tiny_model)
+    a = torch.randn(8, generator=make_generator("lindofr01", fp, 7))
+    b = torch.randn(8, generator=make_generator("lindofr01", fp, 7))
+    assert torch.equal(a, b)
+
+    other_seed = torch.randn(8, generator=make_generator("lindofr01", fp, 8))
+    other_player = torch.randn(8, generator=make_generator("sotoju01", fp, 7))
+    assert not torch.equal(a, other_seed)
+    assert not torch.equal(a, other_player)
+
+
+def test_sample_sub_batches_match_single_calls(tiny_model):
+    fp = model_fingerprint(tiny_model)
+    cond = torch.randn(3, 4).repeat_interleave(16, dim=0).to(device)
+    players = ["a", "b", "c"]
+
+    batched = sample(tiny_model, cond, generator=[make_generator(p, fp, 1) for p in players])
+    for i, p in enumerate(players):
+        single = sample(tiny_model, cond[i * 16:(i + 1) * 16], generator=make_generator(p, fp, 1))
+        assert torch.equal(single, batched[i * 16:(i + 1) * 16])
+
+
+def test_sample_split_sizes_validation(tiny_model):
+    fp = model_fingerprint(tiny_model)
+    cond = torch.zeros(10, 4, device=device)
+    gens = [make_generator(p, fp) for p in ["a", "b", "c"]]
+
+    with pytest.raises(ValueError, match="At least one generator"):
+        sample(tiny_model, cond, generator=[])
+    with pytest.raises(ValueError, match="divisible"):
+        sample(tiny_model, cond, generator=gens)
+    with pytest.raises(ValueError, match="split_sizes"):
+        sample(tiny_model, cond, generator=gens, split_sizes=[5, 5])
+    with pytest.raises(ValueError, match="split_sizes"):
+        sample(tiny_model, cond, generator=gens, split_sizes=[3, 3, 3])
+
+    out = sample(tiny_model, cond, generator=gens, split_sizes=[2, 3, 5])
+    assert out.shape == (10, 2)
+
+
+@pytest.fixture
+def bp(tmp_path, monkeypatch):
+    monkeypatch.setattr(predictor, "N_SAMPLES", 64)
+
+    torch.manual_seed(0)
+    model_path = tmp_path / "model.pt"
+    torch.save({"model": TabDDPMModel(y_dim=2, cond_dim=4, timeEmbShape=32, hidden=256).state_dict()}, model_path)
+
+    people = pd.DataFrame({
+        "playerID": ["lindofr01", "sotoju01"],
+        "nameFirst": ["Francisco", "Juan"],
+        "nameLast": ["Lindor", "Soto"],
+    })
+    season_stats = pd.DataFrame({
+        "playerID": ["lindofr01", "lindofr01", "sotoju01"],
+        "yearID": [2024, 2025, 2025],
+        "PA": [689, 732, 713],
+        "OBP": [0.344, 0.346, 0.396],
+        "SLG": [0.500, 0.466, 0.525],
+        "age": [30.0, 31.0, 26.0],
+    })
+    rng = np.random.default_rng(0)
+    cond_scaler = ZScaler().fit(rng.normal(size=(32, 4)).astype(np.float32))
+    y_scaler = ZScaler().fit(rng.normal(size=(32, 2)).astype(np.float32))
+
+    return BaseballPredictor(str(model_path), cond_scaler, y_scaler, season_stats, people)
+
+
+def test_predict_matches_predict_batch(bp):
+    single = bp.predict("Francisco Lindor", seed=3)
+    assert single == bp.predict("Francisco Lindor", seed=3)
+
+    batched = bp.predict_batch(["Juan Soto", "Francisco Lindor"], seed=3)
+    assert batched[1] == single
+    assert batched[0] == bp.predict("Juan Soto", seed=3)
+
+
+def test_predict_batch_empty(bp):
+    assert bp.predict_batch([]) == []